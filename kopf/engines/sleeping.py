@@ -24,16 +24,22 @@ async def sleep_or_wait(
     actual_delays = [delay for delay in passed_delays if delay is not None]
     minimal_delay = min(actual_delays) if actual_delays else 0
 
-    awakening_event = (
-        wakeup.async_event if isinstance(wakeup, primitives.DaemonStopper) else
-        wakeup if wakeup is not None else
-        asyncio.Event())
-
     loop = asyncio.get_running_loop()
-    try:
-        start_time = loop.time()
-        await asyncio.wait_for(awakening_event.wait(), timeout=minimal_delay)
-    except asyncio.TimeoutError:
+    start_time = loop.time()
+
+    if isinstance(wakeup, primitives.DaemonStopper):
+        # The stoppers wait on their own lightweight future, not on an event.
+        interrupted = await wakeup.wait(timeout=minimal_delay)
+    else:
+        awakening_event = wakeup if wakeup is not None else asyncio.Event()
+        try:
+            await asyncio.wait_for(awakening_event.wait(), timeout=minimal_delay)
+        except asyncio.TimeoutError:
+            interrupted = False
+        else:
+            interrupted = True
+
+    if not interrupted:
         return None  # interruptable sleep is over: uninterrupted.
     else:
         end_time = loop.time()
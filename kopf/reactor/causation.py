@@ -86,7 +86,7 @@ class ResourceChangingCause(ResourceCause):
     """
     initial: bool
     reason: handlers.Reason
-    diff: diffs.Diff = diffs.EMPTY
+    diff: diffs.Diff = dataclasses.field(default_factory=lambda: diffs.EMPTY)
     old: Optional[bodies.BodyEssence] = None
     new: Optional[bodies.BodyEssence] = None
 
@@ -21,9 +21,9 @@ force-killed after some timeout -- which can be avoided, since we are aware
 of the daemons, and they are not actually "hung".
 """
 import asyncio
+import functools
 import time
-import warnings
-from typing import MutableMapping, Sequence, Collection, List
+from typing import Mapping, MutableMapping, Optional, Sequence, Collection, Tuple, cast
 
 from kopf.clients import patching
 from kopf.engines import logging as logging_engine
@@ -41,6 +41,27 @@ from kopf.structs import primitives
 DAEMON_POLLING_INTERVAL = 60
 
 
+def _termination_timings(
+        handler: handlers_.ResourceSpawningHandler,
+) -> Tuple[Optional[float], Optional[float], float]:
+    """
+    Resolve the constant termination timings of a daemon: backoff, timeout, polling.
+
+    The timings are derived from the handler once at spawning, and are stored
+    on the `containers.Daemon` -- so that the termination routines operate
+    on plain floats instead of re-dispatching by the handler kind every cycle.
+    """
+    if handler.kind == 'daemon':
+        daemon_handler = cast(handlers_.ResourceDaemonHandler, handler)
+        return (daemon_handler.cancellation_backoff,
+                daemon_handler.cancellation_timeout,
+                daemon_handler.cancellation_polling or DAEMON_POLLING_INTERVAL)
+    elif handler.kind == 'timer':
+        return None, None, DAEMON_POLLING_INTERVAL
+    else:
+        raise RuntimeError(f"Unsupported daemon handler: {handler!r}")
+
+
 async def spawn_resource_daemons(
         *,
         settings: configuration.OperatorSettings,
@@ -70,6 +91,7 @@ async def spawn_resource_daemons(
                 patch=patches.Patch(),  # not the same as the one-shot spawning patch!
                 stopper=stopper,  # for checking (passed to kwargs)
             )
+            backoff, timeout, polling = _termination_timings(handler)
             daemon = containers.Daemon(
                 stopper=stopper,  # for stopping (outside of causes)
                 handler=handler,
@@ -80,15 +102,32 @@ async def spawn_resource_daemons(
                     cause=daemon_cause,
                     memory=memory,
                 )),
+                backoff=backoff,
+                timeout=timeout,
+                polling=polling,
             )
             daemons[daemon_id] = daemon
+
+            # Count the running daemons, so that "are all daemons done?" is one integer read.
+            # The counter is decremented strictly by the event loop, so it is concurrency-safe.
+            memory.running_daemons_count += 1
+            daemon.task.add_done_callback(functools.partial(_on_daemon_exit, memory))
     return []
 
 
+def _on_daemon_exit(
+        memory: containers.ResourceMemory,
+        task: containers.asyncio_Task,
+) -> None:
+    """ A done-callback of every daemon's task: uncount the exited daemon. """
+    memory.running_daemons_count -= 1
+
+
 async def stop_resource_daemons(
         *,
         settings: configuration.OperatorSettings,
         daemons: MutableMapping[containers.DaemonId, containers.Daemon],
+        memory: containers.ResourceMemory,
 ) -> Collection[float]:
     """
     Terminate all daemons of an individual resource (gracefully and by force).
@@ -130,59 +169,71 @@ async def stop_resource_daemons(
     Hence, these duplicating methods of termination for different cases
     (as by their surrounding circumstances: deletion handlers and finalizers).
     """
-    delays: List[float] = []
+    # Most of the handling cycles happen when all daemons have exited long ago (or never were):
+    # skip the whole termination machinery then -- there is nothing to stop or to wait for.
+    # The counter is maintained by the tasks' done-callbacks; it can lag one event-loop cycle
+    # behind the actual task completion, which only delays this shortcut, never misfires it.
+    if not memory.running_daemons_count:
+        return []
+
+    # Snapshot the daemons once: the tuple is iterated with no per-step dict checks,
+    # and it is safe against the mapping being mutated while this coroutine is suspended.
+    snapshot = tuple(daemons.items())
+
+    # Whatever happens with other flags & logs & timings, this flag must be surely set.
+    for _, daemon in snapshot:
+        daemon.stopper.set(reason=primitives.DaemonStoppingReason.RESOURCE_DELETED)
+
+    # It might be so, that the daemons exit instantly (if written properly). Avoid patching and
+    # unnecessary handling cycles in this case: just give the asyncio event loop an extra cycle --
+    # once for all daemons at once, since they all run on the same event loop anyway.
+    if snapshot:
+        await asyncio.sleep(0)
+
+    # Only the nearest deadline matters: the callers min() the returned delays anyway,
+    # so a single running minimum replaces the per-daemon list of delays.
+    min_delay: Optional[float] = None
     now = time.monotonic()
-    for daemon_id, daemon in daemons.items():
+    for daemon_id, daemon in snapshot:
         logger = daemon.logger
         stopper = daemon.stopper
         age = (now - (stopper.when or now))
 
-        if isinstance(daemon.handler, handlers_.ResourceDaemonHandler):
-            backoff = daemon.handler.cancellation_backoff
-            timeout = daemon.handler.cancellation_timeout
-            polling = daemon.handler.cancellation_polling or DAEMON_POLLING_INTERVAL
-        elif isinstance(daemon.handler, handlers_.ResourceTimerHandler):
-            backoff = None
-            timeout = None
-            polling = DAEMON_POLLING_INTERVAL
-        else:
-            raise RuntimeError(f"Unsupported daemon handler: {daemon.handler!r}")
-
-        # Whatever happens with other flags & logs & timings, this flag must be surely set.
-        stopper.set(reason=primitives.DaemonStoppingReason.RESOURCE_DELETED)
-
-        # It might be so, that the daemon exits instantly (if written properly). Avoid patching and
-        # unnecessary handling cycles in this case: just give the asyncio event loop an extra cycle.
-        await asyncio.sleep(0)
+        # The timings are precomputed at spawning: constant for the daemon's lifetime.
+        backoff = daemon.backoff
+        timeout = daemon.timeout
+        polling = daemon.polling
 
         # Try different approaches to exiting the daemon based on timings.
         if daemon.task.done():
-            pass
+            continue
 
         elif backoff is not None and age < backoff:
-            if not stopper.is_set(reason=primitives.DaemonStoppingReason.DAEMON_SIGNALLED):
-                stopper.set(reason=primitives.DaemonStoppingReason.DAEMON_SIGNALLED)
+            if stopper.try_set(reason=primitives.DaemonStoppingReason.DAEMON_SIGNALLED):
                 logger.debug(f"Daemon {daemon_id!r} is signalled to exit gracefully.")
-            delays.append(backoff - age)
+            delay = backoff - age
 
         elif timeout is not None and age < timeout + (backoff or 0):
-            if not stopper.is_set(reason=primitives.DaemonStoppingReason.DAEMON_CANCELLED):
-                stopper.set(reason=primitives.DaemonStoppingReason.DAEMON_CANCELLED)
+            if stopper.try_set(reason=primitives.DaemonStoppingReason.DAEMON_CANCELLED):
                 logger.debug(f"Daemon {daemon_id!r} is signalled to exit by force.")
                 daemon.task.cancel()
-            delays.append(timeout + (backoff or 0) - age)
+            delay = timeout + (backoff or 0) - age
 
         elif timeout is not None:
-            if not stopper.is_set(reason=primitives.DaemonStoppingReason.DAEMON_ABANDONED):
-                stopper.set(reason=primitives.DaemonStoppingReason.DAEMON_ABANDONED)
+            # Only a logged warning, no `warnings.warn()`: the latter walks the stack frames
+            # and the filter registry, which is too costly for a possibly massive shutdown.
+            # The reason's flag guards it: the warning is logged once per abandoned daemon.
+            if stopper.try_set(reason=primitives.DaemonStoppingReason.DAEMON_ABANDONED):
                 logger.warning(f"Daemon {daemon_id!r} did not exit in time. Leaving it orphaned.")
-                warnings.warn(f"Daemon {daemon_id!r} did not exit in time.", ResourceWarning)
+            continue
 
         else:
             logger.debug(f"Daemon {daemon_id!r} is still exiting. Next check is in {polling}s.")
-            delays.append(polling)
+            delay = polling
+
+        min_delay = delay if min_delay is None else min(min_delay, delay)
 
-    return delays
+    return [] if min_delay is None else [min_delay]
 
 
 async def daemon_killer(
@@ -195,19 +246,29 @@ async def daemon_killer(
     """
 
     # Sleep forever, or until cancelled, which happens when the operator begins its shutdown.
+    # A bare never-resolved future is the cheapest way: unlike Event.wait(), it allocates
+    # no event object, no waiters set, and suspends the task exactly once.
     try:
-        await asyncio.Event().wait()
+        await asyncio.get_running_loop().create_future()
     except asyncio.CancelledError:
         pass
 
     # Terminate all running daemons when the operator exits (and this task is cancelled).
-    coros = [
-        stop_daemon(daemon_id=daemon_id, daemon=daemon)
+    # Snapshot the daemons first, and skip those that have exited on their own already:
+    # no stopping coroutines are created for them at all (their DONE flag is set anyway).
+    # A single gather is cheaper than wrapping every coroutine into a task via asyncio.wait
+    # (which is also deprecated for bare coroutines); the exceptions are collected, not raised,
+    # so that one misbehaving daemon does not prevent stopping of all the others.
+    snapshot = tuple(
+        (daemon_id, daemon)
         for memory in memories.iter_all_memories()
         for daemon_id, daemon in memory.daemons.items()
-    ]
-    if coros:
-        await asyncio.wait(coros)
+        if not daemon.task.done()
+    )
+    await asyncio.gather(*(
+        stop_daemon(daemon_id=daemon_id, daemon=daemon)
+        for daemon_id, daemon in snapshot
+    ), return_exceptions=True)
 
 
 async def stop_daemon(
@@ -224,14 +285,9 @@ async def stop_daemon(
 
     For explanation on different implementations, see `stop_resource_daemons`.
     """
-    if isinstance(daemon.handler, handlers_.ResourceDaemonHandler):
-        backoff = daemon.handler.cancellation_backoff
-        timeout = daemon.handler.cancellation_timeout
-    elif isinstance(daemon.handler, handlers_.ResourceTimerHandler):
-        backoff = None
-        timeout = None
-    else:
-        raise RuntimeError(f"Unsupported daemon handler: {daemon.handler!r}")
+    # The timings are precomputed at spawning: constant for the daemon's lifetime.
+    backoff = daemon.backoff
+    timeout = daemon.timeout
 
     # Whatever happens with other flags & logs & timings, this flag must be surely set.
     # It might be so, that the daemon exits instantly (if written properly: give it chance).
@@ -244,18 +300,43 @@ async def stop_daemon(
     if not daemon.task.done() and backoff is not None:
         daemon.stopper.set(reason=primitives.DaemonStoppingReason.DAEMON_SIGNALLED)
         daemon.logger.debug(f"Daemon {daemon_id!r} is signalled to exit gracefully.")
-        await asyncio.wait([daemon.task], timeout=backoff)
+        await _wait_for_exit(daemon=daemon, timeout=backoff)
 
     if not daemon.task.done() and timeout is not None:
         daemon.stopper.set(reason=primitives.DaemonStoppingReason.DAEMON_CANCELLED)
         daemon.logger.debug(f"Daemon {daemon_id!r} is signalled to exit by force.")
         daemon.task.cancel()
-        await asyncio.wait([daemon.task], timeout=timeout)
+        await _wait_for_exit(daemon=daemon, timeout=timeout)
 
     if not daemon.task.done():
         daemon.stopper.set(reason=primitives.DaemonStoppingReason.DAEMON_ABANDONED)
         daemon.logger.warning(f"Daemon {daemon_id!r} did not exit in time. Leaving it orphaned.")
-        warnings.warn(f"Daemon {daemon_id!r} did not exit in time.", ResourceWarning)
+
+
+async def _wait_for_exit(
+        *,
+        daemon: containers.Daemon,
+        timeout: Optional[float],
+) -> None:
+    """
+    Wait for a daemon's task to exit within a time window.
+
+    Cheaper than ``asyncio.wait([task], ...)``, which builds the (done, pending)
+    sets and an extra waiter future for what is always one single task here.
+
+    The task's own outcome is not consumed: a timeout only means "still
+    running" (the caller escalates to the next measure); the task's failures
+    and cancellation are its own business, not the stopping routine's.
+    """
+    try:
+        await asyncio.wait_for(asyncio.shield(daemon.task), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    except asyncio.CancelledError:
+        if not daemon.task.cancelled():
+            raise  # it is the stopping routine that is cancelled, not the daemon's task.
+    except Exception:
+        pass
 
 
 async def _runner(
@@ -272,10 +353,17 @@ async def _runner(
     The runner will not exit until the thread exits. See `invoke` for details.
     """
     try:
-        if isinstance(handler, handlers_.ResourceDaemonHandler):
-            await _resource_daemon(settings=settings, handler=handler, cause=cause)
-        elif isinstance(handler, handlers_.ResourceTimerHandler):
-            await _resource_timer(settings=settings, handler=handler, cause=cause, memory=memory)
+        if handler.kind == 'daemon':
+            await _resource_daemon(
+                settings=settings,
+                handler=cast(handlers_.ResourceDaemonHandler, handler),
+                cause=cause)
+        elif handler.kind == 'timer':
+            await _resource_timer(
+                settings=settings,
+                handler=cast(handlers_.ResourceTimerHandler, handler),
+                cause=cause,
+                memory=memory)
         else:
             raise RuntimeError("Cannot determine which task wrapper to use. This is a bug.")
 
@@ -286,6 +374,98 @@ async def _runner(
         cause.stopper.set(reason=primitives.DaemonStoppingReason.DONE)
 
 
+class _PatchDebouncer:
+    """
+    A coalescer of one daemon's patches over a debounce window.
+
+    With a zero window (the default), every `apply` patches immediately --
+    one PATCH call per iteration, as it has always been. With a positive
+    window, the patches accumulate in the cause's patch across iterations,
+    and go to the API in one PATCH call when the window is over. A timed
+    flush is scheduled for that, so the window is honoured even when the
+    daemon itself sleeps for longer (its intervals and backoffs usually
+    exceed the window). The patches are flushed instantly when the daemon
+    is stopping or exits (nothing may be lost).
+    """
+    __slots__ = ('window', 'cause', 'pending_since', 'flush_task')
+
+    def __init__(
+            self,
+            *,
+            settings: configuration.OperatorSettings,
+            cause: causation.DaemonCause,
+    ) -> None:
+        super().__init__()
+        self.window = settings.batching.patch_debounce
+        self.cause = cause
+        self.pending_since: Optional[float] = None
+        self.flush_task: Optional[containers.asyncio_Task] = None
+
+    async def apply(self) -> None:
+        if not self.cause.patch:
+            return
+        now = time.monotonic()
+        if self.pending_since is None:
+            self.pending_since = now
+        if self.window <= 0 or self.cause.stopper.is_set() or now - self.pending_since >= self.window:
+            await self.flush()
+            return
+        if self.flush_task is not None and self.flush_task.done():
+            # A failure of the deferred patching escalates the same as an immediate one would:
+            # re-raised into the daemon's guarding task (the patch is kept for a retried flush).
+            task, self.flush_task = self.flush_task, None
+            await task
+        if self.flush_task is None:
+            # Deliver the deferred patch when the window elapses, not only when
+            # (and if) the daemon wakes up next time and applies something new.
+            self.flush_task = asyncio.create_task(self._flush_when_elapsed())
+
+    async def _flush_when_elapsed(self) -> None:
+        await asyncio.sleep(max(0.0, (self.pending_since or 0.0) + self.window - time.monotonic()))
+        await self.flush()
+
+    async def flush(self) -> None:
+        # Cancel the scheduled flush (if it is not this one): its job is done here & now.
+        # If it is cancelled amid patching, the patch is not cleared yet, so it is re-sent below:
+        # with the same content, which is safe, -- rather than lost, which is not acceptable.
+        # If it has failed already, its exception is re-raised here instead of being dropped:
+        # the daemons always flush in the end, so a failure surfaces in the daemon's task at worst.
+        task = self.flush_task
+        self.flush_task = None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()  # a no-op if the task is done already (succeeded or failed).
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        cause = self.cause
+        if cause.patch:
+            cause.logger.debug("Patching with: %r", cause.patch)
+            await patching.patch_obj(resource=cause.resource, patch=cause.patch, body=cause.body)
+            cause.patch.clear()
+        self.pending_since = None
+
+
+async def _apply_outcomes(
+        *,
+        state: states.State,
+        outcomes: Mapping[handlers_.HandlerId, states.HandlerOutcome],
+        cause: causation.DaemonCause,
+        patcher: _PatchDebouncer,
+) -> states.State:
+    """
+    The shared post-invocation tail of every daemon/timer iteration.
+
+    The handling state and the patch are updated in one pass over the outcomes;
+    the accumulated patch (if any) is then applied -- immediately or debounced,
+    as the patcher is configured -- and cleared once it is actually applied.
+    """
+    state = state.with_outcomes(outcomes)
+    states.deliver_results(outcomes=outcomes, patch=cause.patch)
+    await patcher.apply()
+    return state
+
+
 async def _resource_daemon(
         *,
         settings: configuration.OperatorSettings,
@@ -306,27 +486,33 @@ async def _resource_daemon(
     if handler.initial_delay is not None:
         await sleeping.sleep_or_wait(handler.initial_delay, cause.stopper)
 
-    # Similar to activities (in-memory execution), but applies patches on every attempt.
-    state = states.State.from_scratch(handlers=[handler])
-    while not cause.stopper.is_set() and not state.done:
-
-        outcomes = await handling.execute_handlers_once(
-            lifecycle=lifecycles.all_at_once,  # there is only one anyway
-            settings=settings,
-            handlers=[handler],
-            cause=cause,
-            state=state,
-        )
-        state = state.with_outcomes(outcomes)
-        states.deliver_results(outcomes=outcomes, patch=cause.patch)
+    # One handler per daemon, invoked in a loop: build the collection and pick
+    # the lifecycle once, not per iteration (both are constant for the daemon).
+    handlers = (handler,)
+    lifecycle = lifecycles.all_at_once  # there is only one handler anyway
 
-        if cause.patch:
-            cause.logger.debug("Patching with: %r", cause.patch)
-            await patching.patch_obj(resource=cause.resource, patch=cause.patch, body=cause.body)
-            cause.patch.clear()
+    # Similar to activities (in-memory execution), but applies patches on every attempt.
+    state = states.State.from_scratch(handlers=handlers)
+    patcher = _PatchDebouncer(settings=settings, cause=cause)
+    try:
+        while not cause.stopper.is_set() and not state.done:
+
+            outcomes = await handling.execute_handlers_once(
+                lifecycle=lifecycle,
+                settings=settings,
+                handlers=handlers,
+                cause=cause,
+                state=state,
+            )
+            state = await _apply_outcomes(state=state, outcomes=outcomes, cause=cause,
+                                          patcher=patcher)
 
-        # The in-memory sleep does not react to resource changes, but only to stopping.
-        await sleeping.sleep_or_wait(state.delay, cause.stopper)
+            # The in-memory sleep does not react to resource changes, but only to stopping.
+            await sleeping.sleep_or_wait(state.delay, cause.stopper)
+    finally:
+        # Nothing may be lost even if the daemon is cancelled: apply the patches that are
+        # still debounced (none if not debouncing), and withdraw the scheduled timed flush.
+        await patcher.flush()
 
     if cause.stopper.is_set():
         logger.debug(f"{handler} has exited on request and will not be retried or restarted.")
@@ -366,70 +552,83 @@ async def _resource_timer(
     if handler.initial_delay is not None:
         await sleeping.sleep_or_wait(handler.initial_delay, cause.stopper)
 
-    # Similar to activities (in-memory execution), but applies patches on every attempt.
-    state = states.State.from_scratch(handlers=[handler])
-    while not cause.stopper.is_set():  # NB: ignore state.done! it is checked below explicitly.
-
-        # Reset success/failure retry counters & timers if it has succeeded. Keep it if failed.
-        # Every next invocation of a successful handler starts the retries from scratch (from zero).
-        if state.done:
-            state = states.State.from_scratch(handlers=[handler])
-
-        # Both `now` and `last_seen_time` are moving targets: the last seen time is updated
-        # on every watch-event received, and prolongs the sleep. The sleep is never shortened.
-        if handler.idle is not None:
-            while not cause.stopper.is_set() and time.monotonic() - memory.idle_reset_time < handler.idle:
-                delay = memory.idle_reset_time + handler.idle - time.monotonic()
-                await sleeping.sleep_or_wait(delay, cause.stopper)
-            if cause.stopper.is_set():
-                continue
-
-        # Remember the start time for the sharp timing and idle-time-waster below.
-        started = time.monotonic()
-
-        # Execute the handler as usually, in-memory, but handle its outcome on every attempt.
-        outcomes = await handling.execute_handlers_once(
-            lifecycle=lifecycles.all_at_once,  # there is only one anyway
-            settings=settings,
-            handlers=[handler],
-            cause=cause,
-            state=state,
-        )
-        state = state.with_outcomes(outcomes)
-        states.deliver_results(outcomes=outcomes, patch=cause.patch)
-
-        # Apply the accumulated patches after every invocation attempt (regardless of its outcome).
-        if cause.patch:
-            cause.logger.debug("Patching with: %r", cause.patch)
-            await patching.patch_obj(resource=cause.resource, patch=cause.patch, body=cause.body)
-            cause.patch.clear()
+    # The scheduling inputs are constant for the handler's lifetime: hoist them into locals,
+    # so that the per-tick branch ladder below does no repeated attribute lookups.
+    interval = handler.interval
+    sharp = handler.sharp
+    idle = handler.idle
 
-        # For temporary errors, override the schedule by the one provided by errors themselves.
-        # It can be either a delay from TemporaryError, or a backoff for an arbitrary exception.
-        if not state.done:
-            await sleeping.sleep_or_wait(state.delays, cause.stopper)
-
-        # For sharp timers, calculate how much time is left to fit the interval grid:
-        #       |-----|-----|-----|-----|-----|-----|---> (interval=5, sharp=True)
-        #       [slow_handler]....[slow_handler]....[slow...
-        elif handler.interval is not None and handler.sharp:
-            passed_duration = time.monotonic() - started
-            remaining_delay = handler.interval - (passed_duration % handler.interval)
-            await sleeping.sleep_or_wait(remaining_delay, cause.stopper)
-
-        # For regular (non-sharp) timers, simply sleep from last exit to the next call:
-        #       |-----|-----|-----|-----|-----|-----|---> (interval=5, sharp=False)
-        #       [slow_handler].....[slow_handler].....[slow...
-        elif handler.interval is not None:
-            await sleeping.sleep_or_wait(handler.interval, cause.stopper)
-
-        # For idle-only no-interval timers, wait till the next change (i.e. idling reset).
-        # NB: This will skip the handler in the same tact (1/64th of a second) even if changed.
-        elif handler.idle is not None:
-            while memory.idle_reset_time <= started:
-                await sleeping.sleep_or_wait(handler.idle, cause.stopper)
-
-        # Only in case there are no intervals and idling, treat it as a one-shot handler.
-        # This makes the handler practically meaningless, but technically possible.
-        else:
-            break
+    # One handler per timer, invoked in a loop: build the collection and pick
+    # the lifecycle once, not per iteration (both are constant for the timer).
+    handlers = (handler,)
+    lifecycle = lifecycles.all_at_once  # there is only one handler anyway
+
+    # Similar to activities (in-memory execution), but applies patches on every attempt.
+    state = states.State.from_scratch(handlers=handlers)
+    patcher = _PatchDebouncer(settings=settings, cause=cause)
+    try:
+        while not cause.stopper.is_set():  # NB: ignore state.done! it is checked below explicitly.
+
+            # Reset success/failure retry counters & timers if it has succeeded. Keep it if failed.
+            # Every next invocation of a successful handler starts the retries from scratch (zero).
+            if state.done:
+                state = states.State.from_scratch(handlers=handlers)
+
+            # Both `now` and `last_seen_time` are moving targets: the last seen time is updated
+            # on every watch-event received, and prolongs the sleep. The sleep is never shortened.
+            if idle is not None:
+                now = time.monotonic()  # one clock read per iteration, not 2-3 of them.
+                while not cause.stopper.is_set() and now - memory.idle_reset_time < idle:
+                    await sleeping.sleep_or_wait(memory.idle_reset_time + idle - now, cause.stopper)
+                    now = time.monotonic()
+                if cause.stopper.is_set():
+                    continue
+
+            # Remember the start time for the sharp timing and idle-time-waster below.
+            started = time.monotonic()
+
+            # Execute the handler as usually, in-memory, but handle its outcome on every attempt.
+            outcomes = await handling.execute_handlers_once(
+                lifecycle=lifecycle,
+                settings=settings,
+                handlers=handlers,
+                cause=cause,
+                state=state,
+            )
+            # The patches are applied after every invocation attempt (regardless of its outcome).
+            state = await _apply_outcomes(state=state, outcomes=outcomes, cause=cause,
+                                          patcher=patcher)
+
+            # For temporary errors, override the schedule by the one provided by errors themselves.
+            # It can be either a delay from TemporaryError, or a backoff for an arbitrary exception.
+            if not state.done:
+                await sleeping.sleep_or_wait(state.delays, cause.stopper)
+
+            # For sharp timers, calculate how much time is left to fit the interval grid:
+            #       |-----|-----|-----|-----|-----|-----|---> (interval=5, sharp=True)
+            #       [slow_handler]....[slow_handler]....[slow...
+            elif interval is not None and sharp:
+                passed_duration = time.monotonic() - started
+                remaining_delay = interval - (passed_duration % interval)
+                await sleeping.sleep_or_wait(remaining_delay, cause.stopper)
+
+            # For regular (non-sharp) timers, simply sleep from last exit to the next call:
+            #       |-----|-----|-----|-----|-----|-----|---> (interval=5, sharp=False)
+            #       [slow_handler].....[slow_handler].....[slow...
+            elif interval is not None:
+                await sleeping.sleep_or_wait(interval, cause.stopper)
+
+            # For idle-only no-interval timers, wait till the next change (i.e. idling reset).
+            # NB: This will skip the handler in the same tact (1/64th of a second) even if changed.
+            elif idle is not None:
+                while memory.idle_reset_time <= started:
+                    await sleeping.sleep_or_wait(idle, cause.stopper)
+
+            # Only in case there are no intervals and idling, treat it as a one-shot handler.
+            # This makes the handler practically meaningless, but technically possible.
+            else:
+                break
+    finally:
+        # Nothing may be lost even if the timer is cancelled: apply the patches that are
+        # still debounced (none if not debouncing), and withdraw the scheduled timed flush.
+        await patcher.flush()
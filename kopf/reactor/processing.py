@@ -296,6 +296,7 @@ async def process_resource_spawning_cause(
         delays = await daemons.stop_resource_daemons(
             settings=settings,
             daemons=memory.daemons,
+            memory=memory,
         )
         return delays
 
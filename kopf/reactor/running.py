@@ -79,6 +79,42 @@ def login(
         raise
 
 
+def _install_uvloop() -> None:
+    """
+    Install uvloop as the event loop implementation, if it is available.
+
+    The operator's workload is dominated by task scheduling and sleeping
+    (daemons, timers, watch-streams), so the libuv-based loop with its cheaper
+    task and timer machinery gives noticeable gains with many resources.
+
+    uvloop is strictly optional: where it is absent (e.g. on Windows),
+    the standard event loop is silently used, with no difference in behaviour.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def _install_eager_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Start the tasks eagerly, where supported (Python 3.12+).
+
+    Eager tasks run their coroutines synchronously until the first suspension
+    point. Daemons & timers are spawned in bursts (one task per handler per
+    resource), and most of them reach their first sleep instantly --
+    eager tasks save one event-loop round trip per spawn.
+
+    This is only done for the operator's own loop (created by `run`):
+    an explicitly given loop belongs to an embedding application,
+    whose task semantics must not be changed behind its back.
+    """
+    if hasattr(asyncio, 'eager_task_factory'):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+
 def run(
         *,
         loop: Optional[asyncio.AbstractEventLoop] = None,
@@ -100,7 +136,12 @@ def run(
 
     This function should be used to run an operator in normal sync mode.
     """
-    loop = loop if loop is not None else asyncio.get_event_loop()
+    if loop is None:
+        # Only if the loop is ours, not if explicitly given: neither the loop policy
+        # nor the task factory of an embedding application may be changed.
+        _install_uvloop()
+        loop = asyncio.get_event_loop()
+        _install_eager_tasks(loop)
     try:
         loop.run_until_complete(operator(
             lifecycle=lifecycle,
@@ -3,6 +3,11 @@ Callback signatures for typing.
 
 Since these signatures contain a lot of copy-pasted kwargs and are
 not so important for the codebase, they are moved to this separate module.
+
+The protocols are static-typing-only and must never be ``@runtime_checkable``:
+a structural ``isinstance()`` check is orders of magnitude slower than
+a nominal one, and none of the runtime code should dispatch on them anyway
+(the handlers dispatch on their own ``kind`` tags instead).
 """
 import logging
 from typing import NewType, Any, Union, Optional, Callable, Coroutine
@@ -123,6 +123,16 @@ class BatchingSettings:
     This is the time given to the worker to deplete and process the queue.
     """
 
+    patch_debounce: float = 0.0
+    """
+    How long can the daemons/timers accumulate their patches before applying
+    them with one PATCH call (e.g. ``0.05`` for 50 ms). With tight intervals
+    or fast retries, this coalesces several iterations into one API request.
+
+    With the default of ``0``, every iteration patches immediately.
+    The patches are always force-flushed when a daemon stops or exits.
+    """
+
 
 @dataclasses.dataclass
 class ExecutionSettings:
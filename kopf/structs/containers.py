@@ -28,12 +28,38 @@ else:
 DaemonId = NewType('DaemonId', str)
 
 
-@dataclasses.dataclass(frozen=True)
 class Daemon:
-    task: asyncio_Task  # a guarding task of the daemon.
-    logger: Union[logging.Logger, logging.LoggerAdapter]
-    handler: handlers.ResourceSpawningHandler
-    stopper: primitives.DaemonStopper  # a signaller for the termination and its reason.
+    """
+    A daemon's runtime state, allocated once per daemon per resource.
+
+    With thousands of resources, each with a few daemons/timers, the per-instance
+    ``__dict__`` overhead of a regular class (or a dataclass) becomes noticeable,
+    so this container uses ``__slots__`` for a compact fixed layout.
+    """
+    __slots__ = ('task', 'logger', 'handler', 'stopper', 'backoff', 'timeout', 'polling')
+
+    def __init__(
+            self,
+            *,
+            task: asyncio_Task,
+            logger: Union[logging.Logger, logging.LoggerAdapter],
+            handler: handlers.ResourceSpawningHandler,
+            stopper: primitives.DaemonStopper,
+            backoff: Optional[float],
+            timeout: Optional[float],
+            polling: float,
+    ) -> None:
+        super().__init__()
+        self.task = task  # a guarding task of the daemon.
+        self.logger = logger
+        self.handler = handler
+        self.stopper = stopper  # a signaller for the termination and its reason.
+
+        # Termination timings, precomputed once at spawning: they are constant for the daemon's
+        # lifetime, so the regular termination polling does not re-derive them from the handler.
+        self.backoff = backoff  # how long to wait for a graceful exit before cancelling.
+        self.timeout = timeout  # how long to wait for the cancellation before abandoning.
+        self.polling = polling  # how often to re-check a daemon which is exiting on its own.
 
 
 class ObjectDict(Dict[Any, Any]):
@@ -72,6 +98,10 @@ class ResourceMemory:
     daemons: Dict[DaemonId, Daemon] = dataclasses.field(default_factory=dict)
     fully_spawned: bool = False
 
+    # How many daemons' tasks are still running. Maintained by the tasks' done-callbacks,
+    # so the "are all daemons done?" checks are one integer read instead of task polling.
+    running_daemons_count: int = 0
+
 
 class ResourceMemories:
     """
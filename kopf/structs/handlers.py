@@ -1,7 +1,7 @@
 import dataclasses
 import enum
 import warnings
-from typing import NewType, Optional, Any
+from typing import NewType, Optional, Any, ClassVar
 
 from kopf.structs import callbacks
 from kopf.structs import dicts
@@ -141,9 +141,14 @@ class ResourceSpawningHandler(ResourceHandler):
     requires_finalizer: Optional[bool]
     initial_delay: Optional[float]
 
+    # A per-class dispatching tag: a plain attribute lookup is much cheaper than `isinstance()`
+    # checks, which happen in the hot loops of the daemons (spawning, polling, termination).
+    kind: ClassVar[str]
+
 
 @dataclasses.dataclass
 class ResourceDaemonHandler(ResourceSpawningHandler):
+    kind: ClassVar[str] = 'daemon'
     fn: callbacks.ResourceDaemonFn  # type clarification
     cancellation_backoff: Optional[float]  # how long to wait before actual cancellation.
     cancellation_timeout: Optional[float]  # how long to wait before giving up on cancellation.
@@ -155,6 +160,7 @@ class ResourceDaemonHandler(ResourceSpawningHandler):
 
 @dataclasses.dataclass
 class ResourceTimerHandler(ResourceSpawningHandler):
+    kind: ClassVar[str] = 'timer'
     fn: callbacks.ResourceTimerFn  # type clarification
     sharp: Optional[bool]
     idle: Optional[float]
@@ -174,8 +174,8 @@ class DaemonStopper:
         self.reason = DaemonStoppingReason.NONE
         self.sync_checker = SyncDaemonStopperChecker(self)
         self.async_checker = AsyncDaemonStopperChecker(self)
-        self.sync_event = threading.Event()
-        self.async_event = asyncio.Event()
+        self.sync_event = threading.Event()  # for daemons running in the threads.
+        self.async_future: Optional[asyncio_Future] = None  # lazily created by the first waiter.
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}: {self.is_set()}, reason={self.reason}>'
@@ -183,6 +183,9 @@ class DaemonStopper:
     def is_set(self, reason: Optional[DaemonStoppingReason] = None) -> bool:
         """
         Check if the daemon stopper is set: at all or for specific reason.
+
+        The reasons are flags of a bitmask, so the per-reason check is
+        a plain bitwise AND -- cheap enough for the daemons' tick loops.
         """
         return ((reason is None or reason in self.reason) and self.sync_event.is_set())
 
@@ -190,7 +193,58 @@ class DaemonStopper:
         self.when = self.when if self.when is not None else time.monotonic()
         self.reason |= reason
         self.sync_event.set()
-        self.async_event.set()  # it is thread-safe: always called in operator's event loop.
+        if self.async_future is not None and not self.async_future.done():
+            self.async_future.set_result(None)  # it is thread-safe: set in operator's event loop.
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the stopper is set, or until the timeout; report if it is set.
+
+        Unlike an `asyncio.Event`, the lazily created future has no waiters
+        set: it is resolved by `set()` only, and resolving it wakes all the
+        waiters with plain callbacks -- no task wrappers, no `wait_for`
+        shielding/cancellation machinery. A timed wait awaits its own
+        per-wait future chained to the shared one, so the timeout timer of
+        one waiter can never wake the other concurrent waiters (reachable
+        via the user-facing checkers) ahead of their own deadlines.
+        A shared future used up by a cancelled wait is re-created on demand
+        (the stopping state itself is kept in the reasons' bitmask,
+        never in the future).
+        """
+        if not self.is_set():
+            loop = asyncio.get_running_loop()
+            if self.async_future is None or self.async_future.done():
+                self.async_future = loop.create_future()
+            future = self.async_future
+            if timeout is None:
+                await future
+            else:
+                waiter: asyncio_Future = loop.create_future()
+
+                def wake(*_: object) -> None:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+                future.add_done_callback(wake)
+                handle = loop.call_later(timeout, wake)
+                try:
+                    await waiter
+                finally:
+                    handle.cancel()
+                    future.remove_done_callback(wake)
+        return self.is_set()
+
+    def try_set(self, *, reason: DaemonStoppingReason) -> bool:
+        """
+        Set the stopper for a reason; report if this reason is newly set.
+
+        A fused check-and-set: one probe less than `is_set` followed by `set`
+        in the regular termination polling of the daemons.
+        """
+        if self.is_set(reason=reason):
+            return False
+        self.set(reason=reason)
+        return True
 
 
 class DaemonStopperChecker:
@@ -235,8 +289,4 @@ class SyncDaemonStopperChecker(DaemonStopperChecker):
 
 class AsyncDaemonStopperChecker(DaemonStopperChecker):
     async def wait(self, timeout: Optional[float] = None) -> bool:
-        try:
-            await asyncio.wait_for(self._stopper.async_event.wait(), timeout=timeout)
-        except asyncio.TimeoutError:
-            pass
-        return bool(self)
+        return await self._stopper.wait(timeout=timeout)
@@ -49,4 +49,9 @@ setup(
         'aiojobs',
         'pykube-ng>=0.27',  # used only for config parsing
     ],
+    extras_require={
+        'uvloop': [
+            'uvloop',  # a faster event loop implementation (not for Windows)
+        ],
+    },
 )
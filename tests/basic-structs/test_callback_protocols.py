@@ -0,0 +1,29 @@
+import pytest
+
+from kopf.structs import callbacks
+from typing_extensions import Protocol
+
+PROTOCOLS = [
+    callbacks.ActivityFn,
+    callbacks.ResourceWatchingFn,
+    callbacks.ResourceChangingFn,
+    callbacks.ResourceDaemonSyncFn,
+    callbacks.ResourceDaemonAsyncFn,
+    callbacks.ResourceTimerFn,
+    callbacks.WhenFilterFn,
+    callbacks.MetaFilterFn,
+]
+
+
+@pytest.mark.parametrize('proto', PROTOCOLS)
+def test_protocols_are_not_runtime_checkable(proto):
+    # Structural isinstance() checks are too slow for the hot paths; the protocols
+    # must stay typing-only, so that such checks fail fast instead of creeping in.
+    assert not getattr(proto, '_is_runtime_protocol', False)
+    with pytest.raises(TypeError):
+        isinstance(lambda **kwargs: None, proto)
+
+
+@pytest.mark.parametrize('proto', PROTOCOLS)
+def test_protocols_are_protocols(proto):
+    assert issubclass(proto, Protocol)
@@ -47,9 +47,12 @@ def pytest_addoption(parser):
 def pytest_collection_modifyitems(config, items):
 
     # Make all tests in this directory and below asyncio-compatible by default.
+    # Skip the explicitly marked ones: their markers can carry extra options
+    # (e.g. a module-wide event loop), and must stay the closest ones.
     for item in items:
         if asyncio.iscoroutinefunction(item.function):
-            item.add_marker('asyncio')
+            if item.get_closest_marker('asyncio') is None:
+                item.add_marker('asyncio')
 
     # Put all e2e tests to the end, as they are assumed to be slow.
     def _is_e2e(item):
@@ -539,33 +542,28 @@ def assert_logs(caplog):
     """
     def assert_logs_fn(patterns, prohibited=[], strict=False):
         __traceback_hide__ = True
-        remaining_patterns = list(patterns)
+        # Precompile once: the same patterns are re-matched against many messages.
+        remaining_patterns = [re.compile(pattern) for pattern in patterns]
+        prohibited_patterns = [re.compile(pattern) for pattern in prohibited]
         for message in caplog.messages:
-            # The expected pattern is at position 0.
-            # Looking-ahead: if one of the following patterns matches, while the
-            # 0th does not, then the log message is missing, and we fail the test.
-            for idx, pattern in enumerate(remaining_patterns):
-                m = re.search(pattern, message)
-                if m:
-                    if idx == 0:
-                        remaining_patterns[:1] = []
-                        break  # out of `remaining_patterns` cycle
-                    else:
-                        skipped_patterns = remaining_patterns[:idx]
-                        raise AssertionError(f"Few patterns were skipped: {skipped_patterns!r}")
-                elif strict:
-                    raise AssertionError(f"Unexpected log message: {message!r}")
+            # An ordered-subsequence match: advance to the next expected pattern
+            # only when the current one matches -- a single pass over both lists.
+            if remaining_patterns and remaining_patterns[0].search(message):
+                del remaining_patterns[0]
+            elif strict and remaining_patterns:
+                raise AssertionError(f"Unexpected log message: {message!r}")
 
             # Check that the prohibited patterns do not appear in any message.
-            for pattern in prohibited:
-                m = re.search(pattern, message)
-                if m:
-                    raise AssertionError(f"Prohibited log pattern found: {message!r} ~ {pattern!r}")
+            for pattern in prohibited_patterns:
+                if pattern.search(message):
+                    raise AssertionError(f"Prohibited log pattern found:"
+                                         f" {message!r} ~ {pattern.pattern!r}")
 
         # If all patterns have been matched in order, we are done.
         # if some are left, but the messages are over, then we fail.
         if remaining_patterns:
-            raise AssertionError(f"Few patterns were missed: {remaining_patterns!r}")
+            missed_patterns = [pattern.pattern for pattern in remaining_patterns]
+            raise AssertionError(f"Few patterns were missed: {missed_patterns!r}")
 
     return assert_logs_fn
 
@@ -123,8 +123,7 @@ async def test_daemon_is_abandoned_due_to_cancellation_timeout_reached(
     # 2rd cycle: the daemon has exited, the resource should be unblocked from actual deletion.
     mocker.resetall()
     frozen_time.tick(50)
-    with pytest.warns(ResourceWarning, match=r"Daemon .+ did not exit in time"):
-        await simulate_cycle(event_object)
+    await simulate_cycle(event_object)
 
     assert k8s_mocked.sleep_or_wait.call_count == 0
     assert k8s_mocked.patch_obj.call_count == 1
@@ -0,0 +1,161 @@
+import asyncio
+import copy
+import logging
+
+import pytest
+
+import kopf
+from kopf.reactor.daemons import _PatchDebouncer
+from kopf.reactor.causation import DaemonCause
+from kopf.storage.finalizers import FINALIZER
+from kopf.structs.bodies import Body
+from kopf.structs.containers import DaemonId, ObjectDict
+from kopf.structs.patches import Patch
+from kopf.structs.primitives import DaemonStopper, DaemonStoppingReason
+
+
+@pytest.fixture()
+def seen_patches(k8s_mocked):
+    """
+    The patch contents as they were sent to the API, snapshotted.
+
+    The debouncer clears the shared patch object once it is applied,
+    so the mock's recorded call args end up empty and cannot be asserted on.
+    """
+    seen = []
+    k8s_mocked.patch_obj.side_effect = lambda *, patch, **_: seen.append(copy.deepcopy(dict(patch)))
+    return seen
+
+
+@pytest.fixture()
+def daemon_cause(resource):
+    return DaemonCause(
+        resource=resource,
+        logger=logging.getLogger('kopf.test.fake.logger'),
+        body=Body({}),
+        memo=ObjectDict(),
+        patch=Patch(),
+        stopper=DaemonStopper(),
+    )
+
+
+async def test_zero_window_patches_on_every_apply(settings, daemon_cause, seen_patches):
+    patcher = _PatchDebouncer(settings=settings, cause=daemon_cause)
+    daemon_cause.patch['status'] = {'x': 1}
+    await patcher.apply()
+
+    assert seen_patches == [{'status': {'x': 1}}]
+    assert not daemon_cause.patch
+
+
+async def test_applies_within_the_window_coalesce_into_one_patch(
+        settings, daemon_cause, seen_patches):
+    settings.batching.patch_debounce = 10.0
+    patcher = _PatchDebouncer(settings=settings, cause=daemon_cause)
+    daemon_cause.patch['status'] = {'x': 1}
+    await patcher.apply()
+    daemon_cause.patch['status']['y'] = 2
+    await patcher.apply()
+
+    assert seen_patches == []  # held back until the window is over.
+
+    await patcher.flush()
+
+    assert seen_patches == [{'status': {'x': 1, 'y': 2}}]
+    assert not daemon_cause.patch
+
+
+async def test_timed_flush_fires_while_the_daemon_sleeps(settings, daemon_cause, seen_patches):
+    settings.batching.patch_debounce = 0.1
+    patcher = _PatchDebouncer(settings=settings, cause=daemon_cause)
+    daemon_cause.patch['status'] = {'x': 1}
+    await patcher.apply()
+
+    assert seen_patches == []  # not yet: the window is not over.
+
+    await asyncio.sleep(0.3)  # as if the daemon sleeps over the window; no new applies.
+
+    assert seen_patches == [{'status': {'x': 1}}]
+    assert not daemon_cause.patch
+
+
+async def test_apply_flushes_instantly_when_the_daemon_is_stopping(
+        settings, daemon_cause, seen_patches):
+    settings.batching.patch_debounce = 10.0
+    patcher = _PatchDebouncer(settings=settings, cause=daemon_cause)
+    daemon_cause.stopper.set(reason=DaemonStoppingReason.DAEMON_SIGNALLED)
+    daemon_cause.patch['status'] = {'x': 1}
+    await patcher.apply()
+
+    assert seen_patches == [{'status': {'x': 1}}]
+    assert not daemon_cause.patch
+
+
+async def test_failed_timed_flush_is_reraised_and_the_patch_is_kept(
+        settings, daemon_cause, k8s_mocked):
+    settings.batching.patch_debounce = 0.1
+    k8s_mocked.patch_obj.side_effect = Exception("boom!")
+    patcher = _PatchDebouncer(settings=settings, cause=daemon_cause)
+    daemon_cause.patch['status'] = {'x': 1}
+    await patcher.apply()
+    await asyncio.sleep(0.3)  # the timed flush fails in the background.
+
+    with pytest.raises(Exception, match=r"boom!"):
+        await patcher.flush()
+
+    assert daemon_cause.patch == {'status': {'x': 1}}  # not lost: ready for a retried flush.
+
+
+async def test_debounced_patches_coalesce_across_timer_ticks(
+        registry, resource, dummy, settings,
+        caplog, assert_logs, k8s_mocked, seen_patches, simulate_cycle, frozen_time):
+    caplog.set_level(logging.DEBUG)
+    settings.batching.patch_debounce = 10.0
+
+    @kopf.timer(resource.group, resource.version, resource.plural, registry=registry, id='fn',
+                interval=1.0)
+    async def fn(**kwargs):
+        dummy.mock()
+        dummy.kwargs = kwargs
+        dummy.steps['called'].set()
+        kwargs['patch'].setdefault('status', {})[f'tick{dummy.mock.call_count}'] = True
+        if dummy.mock.call_count >= 3:
+            kwargs['stopped']._stopper.set(reason=kopf.DaemonStoppingReason.NONE)  # to exit
+
+    await simulate_cycle({})
+    await dummy.steps['called'].wait()
+    await dummy.wait_for_daemon_done()
+
+    assert dummy.mock.call_count == 3
+    status_patches = [patch for patch in seen_patches if 'status' in patch]
+    assert len(status_patches) == 1  # one PATCH call instead of three.
+    assert status_patches[0]['status'] == {'tick1': True, 'tick2': True, 'tick3': True}
+
+
+async def test_pending_patches_are_flushed_when_the_daemon_is_cancelled(
+        registry, resource, dummy, memories, settings,
+        caplog, assert_logs, k8s_mocked, seen_patches, simulate_cycle, mocker):
+    caplog.set_level(logging.DEBUG)
+    settings.batching.patch_debounce = 10.0
+
+    @kopf.daemon(resource.group, resource.version, resource.plural, registry=registry, id='fn')
+    async def fn(**kwargs):
+        dummy.kwargs = kwargs
+        kwargs['patch'].setdefault('status', {})['key'] = 'val'
+        dummy.steps['called'].set()
+        await asyncio.Event().wait()  # this one is cancelled.
+
+    event_object = {'metadata': {'finalizers': [FINALIZER]}}
+    await simulate_cycle(event_object)
+    await dummy.steps['called'].wait()
+
+    # Cancel the daemon's task directly, as the operator's daemon-killer does on exit.
+    mocker.resetall()
+    seen_patches.clear()
+    memory = await memories.recall(event_object)
+    memory.daemons[DaemonId('fn')].task.cancel()
+    await dummy.wait_for_daemon_done()
+
+    status_patches = [patch for patch in seen_patches if 'status' in patch]
+    assert len(status_patches) == 1  # the pending patch is not lost on cancellation.
+    assert status_patches[0]['status'] == {'key': 'val'}
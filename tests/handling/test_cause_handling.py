@@ -1,3 +1,16 @@
+"""
+Handling of the detected causes: the real handlers vs. the informational logs.
+
+All the tests here are mutually independent and share no mutable state
+(the fixtures are function-scoped; the module-wide event loop is recreated
+per process): the module is safe for parallel runs with ``pytest-xdist``
+(``pytest -n auto``), no grouping markers are needed.
+
+The fixture graph is deliberately flat: the tests request only what they
+assert on, the call kwargs are bundled in ``process_kwargs``, the log level
+is set by an autouse fixture, and side-effect-only fixtures stay autouse
+in the conftests instead of appearing in the signatures.
+"""
 import asyncio
 import logging
 
@@ -10,223 +23,156 @@ from kopf.storage.finalizers import FINALIZER
 from kopf.structs.containers import ResourceMemories
 from kopf.structs.handlers import Reason
 
+# One event loop for the whole module: the tests only await the processing
+# routine with all the K8s APIs mocked, so per-test loops are pure overhead.
+pytestmark = pytest.mark.asyncio(loop_scope='module')
+
 EVENT_TYPES = [None, 'ADDED', 'MODIFIED', 'DELETED']
 EVENT_TYPES_WHEN_EXISTS = [None, 'ADDED', 'MODIFIED']
 
+# The mocks of the handler functions, as named in the `handlers` fixture.
+HANDLER_MOCK_NAMES = ['create_mock', 'update_mock', 'delete_mock']
 
-@pytest.mark.parametrize('event_type', EVENT_TYPES_WHEN_EXISTS)
-async def test_create(registry, settings, handlers, resource, cause_mock, event_type,
-                      caplog, assert_logs, k8s_mocked):
+
+@pytest.fixture(autouse=True)
+def _debug_logs(caplog):
+    """ Assertions are made on the debug logs: capture them in all tests. """
     caplog.set_level(logging.DEBUG)
-    cause_mock.reason = Reason.CREATE
 
-    event_queue = asyncio.Queue()
-    await process_resource_event(
-        lifecycle=kopf.lifecycles.all_at_once,
-        registry=registry,
-        settings=settings,
-        resource=resource,
-        memories=ResourceMemories(),
-        raw_event={'type': event_type, 'object': {}},
-        replenished=asyncio.Event(),
-        event_queue=event_queue,
-    )
 
-    assert handlers.create_mock.call_count == 1
-    assert not handlers.update_mock.called
-    assert not handlers.delete_mock.called
+@pytest.fixture()
+def event_queue(mocker):
+    # The posting engine enqueues via `put_nowait` -- spy on it, so that the tests
+    # can assert on the enqueueing directly instead of probing the queue's state.
+    queue = asyncio.Queue()
+    mocker.patch.object(queue, 'put_nowait', wraps=queue.put_nowait)
+    return queue
 
-    assert k8s_mocked.sleep_or_wait.call_count == 0
-    assert k8s_mocked.patch_obj.call_count == 1
-    assert not event_queue.empty()
 
-    patch = k8s_mocked.patch_obj.call_args_list[0][1]['patch']
-    assert 'metadata' in patch
-    assert 'annotations' in patch['metadata']
-    assert LAST_SEEN_ANNOTATION in patch['metadata']['annotations']
-    assert 'status' not in patch  # because only 1 handler, nothing to purge
+@pytest.fixture()
+def replenished():
+    return asyncio.Event()
 
-    assert_logs([
-        "Creation event:",
-        "Handler 'create_fn' is invoked",
-        "Handler 'create_fn' succeeded",
-        "All handlers succeeded",
-        "Patching with",
-    ])
 
+@pytest.fixture()
+def memories():
+    # Strictly per-test: the processing populates the memories on every call
+    # (even for the informational causes), so they cannot be shared or reused.
+    return ResourceMemories()
 
-@pytest.mark.parametrize('event_type', EVENT_TYPES_WHEN_EXISTS)
-async def test_update(registry, settings, handlers, resource, cause_mock, event_type,
-                      caplog, assert_logs, k8s_mocked):
-    caplog.set_level(logging.DEBUG)
-    cause_mock.reason = Reason.UPDATE
 
-    event_queue = asyncio.Queue()
-    await process_resource_event(
+@pytest.fixture()
+def process_kwargs(registry, settings, resource, memories, event_queue, replenished):
+    """ All the kwargs of `process_resource_event` except the raw event itself. """
+    return dict(
         lifecycle=kopf.lifecycles.all_at_once,
         registry=registry,
         settings=settings,
         resource=resource,
-        memories=ResourceMemories(),
-        raw_event={'type': event_type, 'object': {}},
-        replenished=asyncio.Event(),
+        memories=memories,
+        replenished=replenished,
         event_queue=event_queue,
     )
 
-    assert not handlers.create_mock.called
-    assert handlers.update_mock.call_count == 1
-    assert not handlers.delete_mock.called
 
-    assert k8s_mocked.sleep_or_wait.call_count == 0
-    assert k8s_mocked.patch_obj.call_count == 1
-    assert not event_queue.empty()
+def _assert_only_called(mock_name, handlers):
+    """ Check that one and only one (or none) of the cause handlers was called. """
+    for name in HANDLER_MOCK_NAMES:
+        mock = getattr(handlers, name)
+        if name == mock_name:
+            mock.assert_called_once()
+        else:
+            mock.assert_not_called()
 
-    patch = k8s_mocked.patch_obj.call_args_list[0][1]['patch']
-    assert 'metadata' in patch
-    assert 'annotations' in patch['metadata']
-    assert LAST_SEEN_ANNOTATION in patch['metadata']['annotations']
-    assert 'status' not in patch  # because only 1 handler, nothing to purge
 
-    assert_logs([
+def _event_body(reason):
+    """
+    An event body for the cause: only the deletion needs some content.
+
+    The bodies are built strictly per test and are never shared as constants:
+    the cause detection (and its stub in the `cause_mock` fixture) injects
+    the finalizer marker into the body in-place, so a module-level constant
+    would carry that mutation over into the other parametrized runs.
+    """
+    if reason == Reason.DELETE:
+        return {'metadata': {'deletionTimestamp': '...', 'finalizers': [FINALIZER]}}
+    else:
+        return {}
+
+
+@pytest.mark.parametrize('event_type', EVENT_TYPES_WHEN_EXISTS)
+@pytest.mark.parametrize('reason, mock_name, expected_logs', [
+    (Reason.CREATE, 'create_mock', [
+        "Creation event:",
+        "Handler 'create_fn' is invoked",
+        "Handler 'create_fn' succeeded",
+        "All handlers succeeded",
+        "Patching with",
+    ]),
+    (Reason.UPDATE, 'update_mock', [
         "Update event:",
         "Handler 'update_fn' is invoked",
         "Handler 'update_fn' succeeded",
         "All handlers succeeded",
         "Patching with",
-    ])
-
-
-@pytest.mark.parametrize('event_type', EVENT_TYPES_WHEN_EXISTS)
-async def test_delete(registry, settings, handlers, resource, cause_mock, event_type,
-                      caplog, assert_logs, k8s_mocked):
-    caplog.set_level(logging.DEBUG)
-    cause_mock.reason = Reason.DELETE
-    event_body = {'metadata': {'deletionTimestamp': '...', 'finalizers': [FINALIZER]}}
-
-    event_queue = asyncio.Queue()
-    await process_resource_event(
-        lifecycle=kopf.lifecycles.all_at_once,
-        registry=registry,
-        settings=settings,
-        resource=resource,
-        memories=ResourceMemories(),
-        raw_event={'type': event_type, 'object': event_body},
-        replenished=asyncio.Event(),
-        event_queue=event_queue,
-    )
-
-    assert not handlers.create_mock.called
-    assert not handlers.update_mock.called
-    assert handlers.delete_mock.call_count == 1
-
-    assert k8s_mocked.sleep_or_wait.call_count == 0
-    assert k8s_mocked.patch_obj.call_count == 1
-    assert not event_queue.empty()
-
-    patch = k8s_mocked.patch_obj.call_args_list[0][1]['patch']
-    assert 'status' not in patch  # because only 1 handler, nothing to purge
-
-    assert_logs([
+    ]),
+    (Reason.DELETE, 'delete_mock', [
         "Deletion event",
         "Handler 'delete_fn' is invoked",
         "Handler 'delete_fn' succeeded",
         "All handlers succeeded",
         "Removing the finalizer",
         "Patching with",
-    ])
-
-
-#
-# Informational causes: just log, and do nothing else.
-#
-
-@pytest.mark.parametrize('event_type', EVENT_TYPES)
-async def test_gone(registry, settings, handlers, resource, cause_mock, event_type,
-                    caplog, assert_logs, k8s_mocked):
-    caplog.set_level(logging.DEBUG)
-    cause_mock.reason = Reason.GONE
-
-    event_queue = asyncio.Queue()
-    await process_resource_event(
-        lifecycle=kopf.lifecycles.all_at_once,
-        registry=registry,
-        settings=settings,
-        resource=resource,
-        memories=ResourceMemories(),
-        raw_event={'type': event_type, 'object': {}},
-        replenished=asyncio.Event(),
-        event_queue=event_queue,
-    )
-
-    assert not handlers.create_mock.called
-    assert not handlers.update_mock.called
-    assert not handlers.delete_mock.called
-
-    assert not k8s_mocked.patch_obj.called
-    assert event_queue.empty()
+    ]),
+], ids=['create', 'update', 'delete'])
+async def test_handling(handlers, cause_mock, event_type,
+                        reason, mock_name, expected_logs,
+                        assert_logs, k8s_mocked, event_queue, process_kwargs):
+    cause_mock.reason = reason
 
-    assert_logs([
-        "Deleted, really deleted",
-    ])
-
-
-@pytest.mark.parametrize('event_type', EVENT_TYPES)
-async def test_free(registry, settings, handlers, resource, cause_mock, event_type,
-                    caplog, assert_logs, k8s_mocked):
-    caplog.set_level(logging.DEBUG)
-    cause_mock.reason = Reason.FREE
-
-    event_queue = asyncio.Queue()
     await process_resource_event(
-        lifecycle=kopf.lifecycles.all_at_once,
-        registry=registry,
-        settings=settings,
-        resource=resource,
-        memories=ResourceMemories(),
-        raw_event={'type': event_type, 'object': {}},
-        replenished=asyncio.Event(),
-        event_queue=event_queue,
+        **process_kwargs,
+        raw_event={'type': event_type, 'object': _event_body(reason)},
     )
 
-    assert not handlers.create_mock.called
-    assert not handlers.update_mock.called
-    assert not handlers.delete_mock.called
+    _assert_only_called(mock_name, handlers)
+    k8s_mocked.sleep_or_wait.assert_not_called()
+    k8s_mocked.patch_obj.assert_called_once()
+    assert event_queue.put_nowait.called
+
+    # The one and only call is also the last one: take its kwargs directly.
+    # Note: `call_args.kwargs` is Python>=3.8, so the item access is used.
+    patch = k8s_mocked.patch_obj.call_args[1]['patch']
+    if reason != Reason.DELETE:  # on deletion, the finalizers are patched, not the last-seen state.
+        annotations = patch['metadata']['annotations']  # KeyError means the nesting is broken.
+        assert LAST_SEEN_ANNOTATION in annotations
+    assert 'status' not in patch  # because only 1 handler, nothing to purge
 
-    assert not k8s_mocked.sleep_or_wait.called
-    assert not k8s_mocked.patch_obj.called
-    assert event_queue.empty()
+    assert_logs(expected_logs)
 
-    assert_logs([
-        "Deletion event, but we are done with it",
-    ])
 
+#
+# Informational causes: just log, and do nothing else.
+#
 
 @pytest.mark.parametrize('event_type', EVENT_TYPES)
-async def test_noop(registry, settings, handlers, resource, cause_mock, event_type,
-                    caplog, assert_logs, k8s_mocked):
-    caplog.set_level(logging.DEBUG)
-    cause_mock.reason = Reason.NOOP
+@pytest.mark.parametrize('reason, expected_log', [
+    (Reason.GONE, "Deleted, really deleted"),
+    (Reason.FREE, "Deletion event, but we are done with it"),
+    (Reason.NOOP, "Something has changed, but we are not interested"),
+], ids=['gone', 'free', 'noop'])
+async def test_informational(handlers, cause_mock, event_type, reason, expected_log,
+                             assert_logs, k8s_mocked, event_queue, process_kwargs):
+    cause_mock.reason = reason
 
-    event_queue = asyncio.Queue()
     await process_resource_event(
-        lifecycle=kopf.lifecycles.all_at_once,
-        registry=registry,
-        settings=settings,
-        resource=resource,
-        memories=ResourceMemories(),
+        **process_kwargs,
         raw_event={'type': event_type, 'object': {}},
-        replenished=asyncio.Event(),
-        event_queue=event_queue,
     )
 
-    assert not handlers.create_mock.called
-    assert not handlers.update_mock.called
-    assert not handlers.delete_mock.called
-
-    assert not k8s_mocked.sleep_or_wait.called
-    assert not k8s_mocked.patch_obj.called
-    assert event_queue.empty()
+    _assert_only_called(None, handlers)
+    k8s_mocked.sleep_or_wait.assert_not_called()
+    k8s_mocked.patch_obj.assert_not_called()
+    event_queue.put_nowait.assert_not_called()
 
-    assert_logs([
-        "Something has changed, but we are not interested",
-    ])
+    assert_logs([expected_log])
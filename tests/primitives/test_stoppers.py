@@ -0,0 +1,131 @@
+import asyncio
+import functools
+
+from kopf.structs.primitives import DaemonStopper, DaemonStoppingReason
+
+
+async def test_stopper_is_not_set_initially():
+    stopper = DaemonStopper()
+    assert not stopper.is_set()
+    assert not stopper.is_set(reason=DaemonStoppingReason.DAEMON_SIGNALLED)
+
+
+async def test_stopper_is_set_with_its_reason():
+    stopper = DaemonStopper()
+    stopper.set(reason=DaemonStoppingReason.DAEMON_SIGNALLED)
+    assert stopper.is_set()
+    assert stopper.is_set(reason=DaemonStoppingReason.DAEMON_SIGNALLED)
+    assert not stopper.is_set(reason=DaemonStoppingReason.DAEMON_CANCELLED)
+
+
+async def test_waiting_of_preset_stopper_is_instant(timer):
+    stopper = DaemonStopper()
+    stopper.set(reason=DaemonStoppingReason.DAEMON_SIGNALLED)
+    with timer:
+        result = await asyncio.wait_for(stopper.wait(timeout=1.0), timeout=1.0)
+    assert result is True
+    assert timer.seconds < 0.5  # near-instant, plus code overhead
+
+
+async def test_waiting_of_unset_stopper_times_out(timer):
+    stopper = DaemonStopper()
+    with timer:
+        result = await asyncio.wait_for(stopper.wait(timeout=0.1), timeout=1.0)
+    assert result is False
+    assert timer.seconds >= 0.1
+
+
+async def test_waiting_for_stopper_set_during_the_wait(timer):
+    stopper = DaemonStopper()
+    asyncio.get_running_loop().call_later(
+        0.2, functools.partial(stopper.set, reason=DaemonStoppingReason.DAEMON_SIGNALLED))
+    with timer:
+        result = await asyncio.wait_for(stopper.wait(timeout=1.0), timeout=1.0)
+    assert result is True
+    assert 0.2 <= timer.seconds < 0.5  # near-instant once set
+
+
+async def test_waiting_again_after_a_timed_out_wait(timer):
+    stopper = DaemonStopper()
+    result = await asyncio.wait_for(stopper.wait(timeout=0.1), timeout=1.0)
+    assert result is False
+
+    # The used-up future must be re-created, and the new wait must be fully functional.
+    asyncio.get_running_loop().call_later(
+        0.2, functools.partial(stopper.set, reason=DaemonStoppingReason.DAEMON_SIGNALLED))
+    with timer:
+        result = await asyncio.wait_for(stopper.wait(timeout=1.0), timeout=1.0)
+    assert result is True
+    assert 0.2 <= timer.seconds < 0.5
+
+
+async def test_waiting_again_after_a_cancelled_wait(timer):
+    stopper = DaemonStopper()
+    task = asyncio.get_running_loop().create_task(stopper.wait(timeout=1.0))
+    await asyncio.sleep(0.1)  # let the wait start and install its future & handle.
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+    # The cancelled future must be re-created, and the new wait must be fully functional.
+    asyncio.get_running_loop().call_later(
+        0.2, functools.partial(stopper.set, reason=DaemonStoppingReason.DAEMON_SIGNALLED))
+    with timer:
+        result = await asyncio.wait_for(stopper.wait(timeout=1.0), timeout=1.0)
+    assert result is True
+    assert 0.2 <= timer.seconds < 0.5
+
+
+async def test_stale_timeout_handle_does_not_wake_the_next_wait(timer):
+    stopper = DaemonStopper()
+    task = asyncio.get_running_loop().create_task(stopper.wait(timeout=0.3))
+    await asyncio.sleep(0.1)  # let the wait start and install its future & handle.
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+    # The cancelled wait's timer handle (due at 0.3) must not resolve the new future:
+    # the new wait must run its full own timeout, not be woken by the stale handle.
+    with timer:
+        result = await asyncio.wait_for(stopper.wait(timeout=0.5), timeout=1.0)
+    assert result is False
+    assert timer.seconds >= 0.5
+
+
+async def test_concurrent_waits_have_independent_timeouts(timer):
+    stopper = DaemonStopper()
+    short_wait = asyncio.get_running_loop().create_task(stopper.wait(timeout=0.1))
+
+    # The short wait's timeout must not wake the long wait ahead of its own deadline.
+    with timer:
+        result = await asyncio.wait_for(stopper.wait(timeout=0.5), timeout=1.0)
+    assert result is False
+    assert timer.seconds >= 0.5
+    assert await short_wait is False
+
+
+async def test_concurrent_waits_all_wake_when_set(timer):
+    stopper = DaemonStopper()
+    loop = asyncio.get_running_loop()
+    timed_wait = loop.create_task(stopper.wait(timeout=1.0))
+    untimed_wait = loop.create_task(stopper.wait())
+    loop.call_later(
+        0.2, functools.partial(stopper.set, reason=DaemonStoppingReason.DAEMON_SIGNALLED))
+    with timer:
+        results = await asyncio.wait_for(asyncio.gather(timed_wait, untimed_wait), timeout=1.0)
+    assert results == [True, True]
+    assert 0.2 <= timer.seconds < 0.5
+
+
+async def test_checkers_wait_for_the_stopper(timer):
+    stopper = DaemonStopper()
+    asyncio.get_running_loop().call_later(
+        0.2, functools.partial(stopper.set, reason=DaemonStoppingReason.DAEMON_SIGNALLED))
+    with timer:
+        result = await asyncio.wait_for(stopper.async_checker.wait(timeout=1.0), timeout=1.0)
+    assert result is True
+    assert 0.2 <= timer.seconds < 0.5
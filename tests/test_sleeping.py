@@ -1,7 +1,10 @@
 import asyncio
+import functools
+
 import pytest
 
 from kopf.engines.sleeping import sleep_or_wait
+from kopf.structs.primitives import DaemonStopper, DaemonStoppingReason
 
 
 async def test_the_only_delay_is_awaited(timer):
@@ -69,3 +72,31 @@ async def test_with_zero_time_and_event_initially_set(timer):
         unslept = await asyncio.wait_for(sleep_or_wait(0, event), timeout=1.0)
     assert timer.seconds <= 0.01
     assert not unslept  # 0/None; undefined for such case: both goals reached.
+
+
+async def test_by_stopper_not_set_in_time(timer):
+    stopper = DaemonStopper()
+    with timer:
+        unslept = await asyncio.wait_for(sleep_or_wait(0.10, stopper), timeout=1.0)
+    assert 0.10 <= timer.seconds < 0.11
+    assert unslept is None
+
+
+async def test_by_stopper_set_before_time_comes(timer):
+    stopper = DaemonStopper()
+    asyncio.get_running_loop().call_later(
+        0.07, functools.partial(stopper.set, reason=DaemonStoppingReason.DAEMON_SIGNALLED))
+    with timer:
+        unslept = await asyncio.wait_for(sleep_or_wait(0.10, stopper), timeout=1.0)
+    assert unslept is not None
+    assert 0.02 <= unslept <= 0.04
+    assert 0.06 <= timer.seconds <= 0.08
+
+
+async def test_by_stopper_initially_set(timer):
+    stopper = DaemonStopper()
+    stopper.set(reason=DaemonStoppingReason.DAEMON_SIGNALLED)
+    with timer:
+        unslept = await asyncio.wait_for(sleep_or_wait(0.10, stopper), timeout=1.0)
+    assert timer.seconds <= 0.01
+    assert unslept is not None